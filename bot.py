@@ -1,24 +1,50 @@
- 
 import os
 import re
-import json
+import hmac
+import mmap
+import time
+import array
+import bisect
+import random
+import hashlib
 import asyncio
+import functools
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 import discord
+import orjson
 import signal
-from urllib.parse import urljoin
+from aiohttp import web
+from discord.http import Route
+from urllib.parse import urljoin, urlsplit
 from discord.ext import tasks
 from dotenv import load_dotenv
 
+# Optional: only needed when CACHE_BACKEND=redis.
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
 load_dotenv()
 
 CACHE_FILE = "cache.json"
+# Snapshot-compact the append-only seen log once it grows past this.
+LOG_COMPACT_BYTES = 1024 * 1024
 MODTALE_BASE_URL = "https://api.modtale.net/"
+MODTALE_BASE_TRIMMED = MODTALE_BASE_URL.rstrip("/")
 _CF_FILE_ID_RE = re.compile(r"/files/(\d+)")
 
+# Accent color shared by every release embed.
+EMBED_COLOR = discord.Color(0x0F172A)
+
+# Skeleton payload handed to Embed.from_dict, which skips the per-field
+# property setters Embed.__init__ would run for every post.
+_EMBED_TEMPLATE = {"color": EMBED_COLOR.value}
+
 
 @dataclass(frozen=True)
 class ModtaleProjectCfg:
@@ -43,6 +69,15 @@ class Config:
     modtale_projects: List[ModtaleProjectCfg]
     curseforge_projects: List[CurseforgeProjectCfg]
 
+    # Optional Modtale webhook listener; polling stays on as a safety net.
+    webhook_port: int = 0
+    webhook_secret: str = ""
+    webhook_public_url: str = ""
+
+    # Seed seen-sets silently the first time a project is polled instead of
+    # posting its entire history to Discord.
+    backfill_on_first_seen: bool = True
+
 
 def require_env(name: str) -> str:
     val = os.getenv(name)
@@ -56,11 +91,18 @@ def _parse_json_env_optional(name: str) -> Any:
     if not raw:
         return []
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as e:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError as e:
         raise RuntimeError(f"Env var {name} must be valid JSON: {e}") from e
 
 
+def _parse_bool_env(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in ("1", "true", "yes", "on")
+
+
 def load_config() -> Config:
     poll_seconds = int(os.getenv("POLL_SECONDS", "300"))
     cf_poll_seconds = int(os.getenv("CURSEFORGE_POLL_SECONDS", str(poll_seconds)))
@@ -103,57 +145,430 @@ def load_config() -> Config:
         curseforge_poll_seconds=cf_poll_seconds,
         modtale_projects=modtale_projects,
         curseforge_projects=curseforge_projects,
+        webhook_port=int(os.getenv("MODTALE_WEBHOOK_PORT", "0")),
+        webhook_secret=(os.getenv("MODTALE_WEBHOOK_SECRET") or "").strip(),
+        webhook_public_url=(os.getenv("MODTALE_WEBHOOK_PUBLIC_URL") or "").strip(),
+        backfill_on_first_seen=_parse_bool_env("BACKFILL_ON_FIRST_SEEN", True),
     )
 
 
+class IntIdSet:
+    """
+    Seen-set for numeric ids backed by a sorted array('Q'): 8 bytes per id
+    versus ~50+ for interned str objects in a set, with bisect for O(log n)
+    membership. Ids that are not integers (defensive) go to a small side set.
+    """
+    __slots__ = ("_arr", "_extra")
+
+    # array('Q') holds unsigned 64-bit values only; anything outside goes to
+    # the side set rather than raising OverflowError mid-poll.
+    _UINT64_MAX = (1 << 64) - 1
+
+    def __init__(self, ids: Any = ()):
+        self._arr = array.array("Q")
+        self._extra: Set[str] = set()
+        for item_id in ids or ():
+            self.add(str(item_id))
+
+    def __contains__(self, item_id: str) -> bool:
+        try:
+            n = int(item_id)
+        except (TypeError, ValueError):
+            return item_id in self._extra
+        if not 0 <= n <= self._UINT64_MAX:
+            return item_id in self._extra
+        idx = bisect.bisect_left(self._arr, n)
+        return idx < len(self._arr) and self._arr[idx] == n
+
+    def __len__(self) -> int:
+        return len(self._arr) + len(self._extra)
+
+    def add(self, item_id: str) -> bool:
+        """Insert an id, returning True when it was not present before."""
+        try:
+            n = int(item_id)
+        except (TypeError, ValueError):
+            n = None
+        if n is None or not 0 <= n <= self._UINT64_MAX:
+            if item_id in self._extra:
+                return False
+            self._extra.add(item_id)
+            return True
+        idx = bisect.bisect_left(self._arr, n)
+        if idx < len(self._arr) and self._arr[idx] == n:
+            return False
+        self._arr.insert(idx, n)
+        return True
+
+    def to_list(self) -> List[Any]:
+        return list(self._arr) + sorted(self._extra)
+
+
 class JsonCache:
     """
     Persistent cache:
     {
       "modtale_seen": {"<project_uuid>": ["v1","v2"]},
-      "curseforge_seen": {"<project_id>": ["6075247","1234567"]}
+      "curseforge_seen": {"<project_id>": ["6075247","1234567"]},
+      "etags": {"<url>": ["<etag>", "<last-modified>"]},
+      "initialized": ["cf:<project_id>", "mt:<project_uuid>"]
     }
+
+    Newly-seen ids go to an append-only JSONL sidecar (path + ".log") with
+    one O(1) write per id; the full snapshot above is only rewritten when
+    the log is compacted or the etag map changes. load() replays the log
+    on top of the snapshot.
     """
     def __init__(self, path: str):
         self.path = path
+        self.log_path = path + ".log"
         self.modtale_seen: Dict[str, Set[str]] = {}
-        self.curseforge_seen: Dict[str, Set[str]] = {}
+        self.curseforge_seen: Dict[str, IntIdSet] = {}
+        self.etags: Dict[str, Tuple[str, str]] = {}
+        self.initialized: Set[str] = set()
+        self._dirty = False
+        self._log_f: Optional[BinaryIO] = None
+        # Serializes mutations (loop thread) against save/close running in an
+        # asyncio.to_thread worker, and keeps snapshot + log consistent.
+        self._io_lock = threading.Lock()
 
     def load(self) -> None:
-        if not os.path.exists(self.path):
+        self._load_snapshot()
+        self._replay_log()
+
+    def _load_snapshot(self) -> None:
+        # mmap can't map empty files, and there is nothing to parse anyway.
+        try:
+            if os.path.getsize(self.path) == 0:
+                return
+        except OSError:
             return
         try:
-            with open(self.path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            # Zero-copy parse: the OS pages the file in on demand and orjson
+            # reads straight from the mapping, skipping the full-file copy a
+            # read() into a bytes object would make.
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    data = orjson.loads(memoryview(mm))
+                finally:
+                    mm.close()
 
             self.modtale_seen = {
                 str(k): set(map(str, v or []))
                 for k, v in (data.get("modtale_seen") or {}).items()
             }
             self.curseforge_seen = {
-                str(k): set(map(str, v or []))
+                str(k): IntIdSet(v or [])
                 for k, v in (data.get("curseforge_seen") or {}).items()
             }
+            self.etags = {
+                str(k): (str((v or ["", ""])[0]), str((v or ["", ""])[1]))
+                for k, v in (data.get("etags") or {}).items()
+            }
+            self.initialized = set(map(str, data.get("initialized") or []))
         except Exception as e:
             print(f"[cache] Failed to load cache; starting fresh: {e}")
             self.modtale_seen = {}
             self.curseforge_seen = {}
+            self.etags = {}
+            self.initialized = set()
+
+    def _replay_log(self) -> None:
+        if not os.path.exists(self.log_path):
+            return
+        try:
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = orjson.loads(line)
+                    ns = entry.get("ns")
+                    project = str(entry.get("p", ""))
+                    item_id = str(entry.get("v", ""))
+                    if not project or not item_id:
+                        continue
+                    if ns == "mt":
+                        self.modtale_seen.setdefault(project, set()).add(item_id)
+                    elif ns == "cf":
+                        self.curseforge_seen.setdefault(project, IntIdSet()).add(item_id)
+        except Exception as e:
+            print(f"[cache] Failed to replay seen log: {e}")
+
+    def _append_log(self, ns: str, project: str, item_id: str) -> None:
+        # Caller holds _io_lock.
+        if self._log_f is None:
+            self._log_f = open(self.log_path, "ab")
+        self._log_f.write(orjson.dumps({"ns": ns, "p": project, "v": item_id}) + b"\n")
+        self._log_f.flush()
 
     def save(self) -> None:
-        data = {
-            "modtale_seen": {k: sorted(v) for k, v in self.modtale_seen.items()},
-            "curseforge_seen": {k: sorted(v) for k, v in self.curseforge_seen.items()},
-        }
-        tmp = self.path + ".tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        os.replace(tmp, self.path)
+        # Hold the lock across snapshot + truncate so no id can land in the
+        # log between serialization and truncation (it would be lost).
+        with self._io_lock:
+            data = {
+                "modtale_seen": {k: sorted(v) for k, v in self.modtale_seen.items()},
+                "curseforge_seen": {k: v.to_list() for k, v in self.curseforge_seen.items()},
+                "etags": {k: list(v) for k, v in self.etags.items()},
+                "initialized": sorted(self.initialized),
+            }
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            os.replace(tmp, self.path)
+            self._truncate_log()
+            self._dirty = False
+
+    def _truncate_log(self) -> None:
+        # The snapshot now holds everything the log recorded.
+        if self._log_f is not None:
+            self._log_f.close()
+            self._log_f = None
+        if os.path.exists(self.log_path):
+            open(self.log_path, "wb").close()
+
+    def compact(self) -> None:
+        """Fold the seen log into the snapshot once it grows past the cap."""
+        try:
+            if os.path.getsize(self.log_path) > LOG_COMPACT_BYTES:
+                self.save()
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        """Flush and fsync the seen log; call on shutdown (SIGINT/SIGTERM)."""
+        with self._io_lock:
+            if self._log_f is not None:
+                self._log_f.flush()
+                os.fsync(self._log_f.fileno())
+                self._log_f.close()
+                self._log_f = None
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def save_if_dirty(self) -> None:
+        """No-op unless the snapshot is stale (e.g. the etag map changed).
+
+        Blocking write; run it off the event loop via asyncio.to_thread.
+        """
+        if self._dirty:
+            self.save()
+
+    def set_etag(self, url: str, etag: str, last_modified: str) -> None:
+        with self._io_lock:
+            if self.etags.get(url) != (etag, last_modified):
+                self.etags[url] = (etag, last_modified)
+                self._dirty = True
+
+    def get_modtale_seen(self, project_uuid: str) -> Set[str]:
+        # setdefault can insert a first-ever project key while save() is
+        # iterating these dicts in a to_thread worker, so it needs the lock
+        # too ("dictionary changed size during iteration" otherwise).
+        with self._io_lock:
+            return self.modtale_seen.setdefault(project_uuid, set())
+
+    def get_curseforge_seen(self, project_id: str) -> IntIdSet:
+        with self._io_lock:
+            return self.curseforge_seen.setdefault(project_id, IntIdSet())
+
+    def mark_initialized(self, key: str) -> None:
+        with self._io_lock:
+            if key not in self.initialized:
+                self.initialized.add(key)
+                self._dirty = True
+
+    def mark_modtale_seen(self, project_uuid: str, version_id: str) -> None:
+        # Inline the setdefault: the getters take the (non-reentrant) lock.
+        with self._io_lock:
+            seen = self.modtale_seen.setdefault(project_uuid, set())
+            if version_id not in seen:
+                seen.add(version_id)
+                self._append_log("mt", project_uuid, version_id)
+
+    def mark_curseforge_seen(self, project_id: str, file_id: str) -> None:
+        with self._io_lock:
+            if self.curseforge_seen.setdefault(project_id, IntIdSet()).add(file_id):
+                self._append_log("cf", project_id, file_id)
+
+    async def claim_modtale_new(self, project_uuid: str, ids: List[str]) -> List[str]:
+        """Single-writer backend: no other replica to arbitrate against, so
+        every candidate is ours. Persistence still goes through
+        mark_modtale_seen once the message is actually sent."""
+        return ids
+
+    async def claim_curseforge_new(self, project_id: str, ids: List[str]) -> List[str]:
+        return ids
+
+
+class RedisCache:
+    """
+    Redis-backed drop-in for JsonCache so multiple bot replicas can share one
+    seen/etag state (keys: modtale:seen:{uuid}, cf:seen:{pid}, initialized,
+    etags). Sets are mirrored in RAM so membership tests stay synchronous,
+    but the mirror alone cannot dedup between live replicas — new ids are
+    claimed with awaited SADDs whose reply decides which replica announces
+    a release. The remaining writes (backfill seeds, etags) go to Redis as
+    fire-and-forget tasks on the bot's event loop.
+    """
+    def __init__(self, url: str):
+        if aioredis is None:
+            raise RuntimeError("CACHE_BACKEND=redis requires the 'redis' package")
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self.modtale_seen: Dict[str, Set[str]] = {}
+        self.curseforge_seen: Dict[str, IntIdSet] = {}
+        self.etags: Dict[str, Tuple[str, str]] = {}
+        self.initialized: Set[str] = set()
+        self.loaded = False
+        self._dirty = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Guards the etag map: save_if_dirty runs in an asyncio.to_thread
+        # worker while the fetcher updates etags on the loop thread.
+        self._etag_lock = threading.Lock()
+        # Strong refs to in-flight writes; the loop itself only holds weak
+        # refs to tasks, so without this a pending SADD could be collected
+        # mid-flight and its exception would go unobserved.
+        self._pending: Set[Any] = set()
+
+    def load(self) -> None:
+        # Redis needs a running event loop; the real load happens in
+        # load_async() before the poll tasks start.
+        pass
+
+    async def load_async(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        async for key in self._redis.scan_iter(match="modtale:seen:*"):
+            uuid = key.split(":", 2)[2]
+            self.modtale_seen[uuid] = set(await self._redis.smembers(key))
+        async for key in self._redis.scan_iter(match="cf:seen:*"):
+            pid = key.split(":", 2)[2]
+            self.curseforge_seen[pid] = IntIdSet(await self._redis.smembers(key))
+        self.initialized = set(await self._redis.smembers("initialized"))
+        for url, packed in (await self._redis.hgetall("etags")).items():
+            etag, _, last_modified = packed.partition("\n")
+            self.etags[url] = (etag, last_modified)
+        self.loaded = True
+
+    def _spawn(self, coro: Any) -> None:
+        try:
+            fut: Any = asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            # Called from a worker thread (asyncio.to_thread); hop back.
+            if self._loop is None:
+                coro.close()
+                return
+            fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._pending.add(fut)
+        fut.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, fut: Any) -> None:
+        self._pending.discard(fut)
+        if fut.cancelled():
+            return
+        e = fut.exception()
+        if e is not None:
+            print(f"[cache] Redis write failed: {e}")
+
+    def save(self) -> None:
+        with self._etag_lock:
+            mapping = {url: f"{etag}\n{lm}" for url, (etag, lm) in self.etags.items()}
+            self._dirty = False
+        if mapping:
+            self._spawn(self._redis.hset("etags", mapping=mapping))
+
+    def save_if_dirty(self) -> None:
+        if self._dirty:
+            self.save()
+
+    def set_etag(self, url: str, etag: str, last_modified: str) -> None:
+        with self._etag_lock:
+            if self.etags.get(url) != (etag, last_modified):
+                self.etags[url] = (etag, last_modified)
+                self._dirty = True
+
+    def compact(self) -> None:
+        # Redis sets need no snapshot compaction.
+        pass
+
+    def close(self) -> None:
+        # Async client; the real teardown happens in aclose().
+        pass
+
+    async def aclose(self) -> None:
+        """Drain in-flight writes and close the client; call on shutdown."""
+        if self._pending:
+            waits = [
+                f if isinstance(f, asyncio.Future) else asyncio.wrap_future(f)
+                for f in list(self._pending)
+            ]
+            await asyncio.gather(*waits, return_exceptions=True)
+        await self._redis.aclose()
 
     def get_modtale_seen(self, project_uuid: str) -> Set[str]:
         return self.modtale_seen.setdefault(project_uuid, set())
 
-    def get_curseforge_seen(self, project_id: str) -> Set[str]:
-        return self.curseforge_seen.setdefault(project_id, set())
+    def get_curseforge_seen(self, project_id: str) -> IntIdSet:
+        return self.curseforge_seen.setdefault(project_id, IntIdSet())
+
+    def mark_initialized(self, key: str) -> None:
+        if key not in self.initialized:
+            self.initialized.add(key)
+            self._spawn(self._redis.sadd("initialized", key))
+
+    def mark_modtale_seen(self, project_uuid: str, version_id: str) -> None:
+        seen = self.get_modtale_seen(project_uuid)
+        if version_id not in seen:
+            seen.add(version_id)
+            self._spawn(self._redis.sadd(f"modtale:seen:{project_uuid}", version_id))
+
+    def mark_curseforge_seen(self, project_id: str, file_id: str) -> None:
+        if self.get_curseforge_seen(project_id).add(file_id):
+            self._spawn(self._redis.sadd(f"cf:seen:{project_id}", file_id))
+
+    async def _claim(self, redis_key: str, mirror: Any, ids: List[str]) -> List[str]:
+        pipe = self._redis.pipeline(transaction=False)
+        for item_id in ids:
+            pipe.sadd(redis_key, item_id)
+        added = await pipe.execute()
+        # Win or lose, every id is in Redis now; mirror them all so the next
+        # diff skips them without another round trip.
+        for item_id in ids:
+            mirror.add(item_id)
+        return [item_id for item_id, was_new in zip(ids, added) if was_new]
+
+    async def claim_modtale_new(self, project_uuid: str, ids: List[str]) -> List[str]:
+        """Atomically claim unseen version ids; returns the subset this
+        replica won and should announce. Ids another replica SADDed first
+        are dropped here, which is what prevents double posts."""
+        return await self._claim(
+            f"modtale:seen:{project_uuid}", self.get_modtale_seen(project_uuid), ids
+        )
+
+    async def claim_curseforge_new(self, project_id: str, ids: List[str]) -> List[str]:
+        return await self._claim(
+            f"cf:seen:{project_id}", self.get_curseforge_seen(project_id), ids
+        )
+
+
+# Session-level default; requests never build their own ClientTimeout.
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, sock_connect=10)
+
+
+def make_http_session() -> aiohttp.ClientSession:
+    """One shared session: pooled keep-alive connections, cached DNS, and a
+    per-host cap so a big project list cannot stampede one API."""
+    connector = aiohttp.TCPConnector(
+        limit=64,
+        limit_per_host=16,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+        keepalive_timeout=75,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=_DEFAULT_TIMEOUT,
+    )
 
 
 async def fetch_text(
@@ -161,19 +576,184 @@ async def fetch_text(
     url: str,
     headers: Optional[Dict[str, str]] = None,
 ) -> str:
-    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
+    async with session.get(url, headers=headers) as resp:
         resp.raise_for_status()
         return await resp.text()
 
 
-async def fetch_json(
+class AsyncTokenBucket:
+    """Token bucket for pacing outbound calls: refills `rate` tokens/sec up
+    to `capacity`; acquire() sleeps until a token is available."""
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, n: int = 1) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.capacity),
+                    self._tokens + (now - self._updated) * self.rate,
+                )
+                self._updated = now
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return
+                await asyncio.sleep((n - self._tokens) / self.rate)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Adapt the refill rate to the server's advertised budget."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        try:
+            remaining_f = float(remaining)
+            reset_after_f = float(reset_after)
+        except (TypeError, ValueError):
+            return
+        if reset_after_f > 0 and remaining_f >= 0:
+            self.rate = max(0.1, remaining_f / reset_after_f)
+
+
+# Per-host pacing for upstream APIs plus one bucket for Discord sends, so a
+# burst of new releases cannot trip 429s on either side.
+LIMITS: Dict[str, AsyncTokenBucket] = {
+    "api.cfwidget.com": AsyncTokenBucket(2.0, 5),
+    "api.modtale.net": AsyncTokenBucket(2.0, 5),
+    "discord_channel": AsyncTokenBucket(5.0, 5),
+}
+
+
+# A release button is just (label, url) — pure link components need no
+# discord.ui.View (which registers a listener + timeout task per message).
+LinkButton = Tuple[str, str]
+
+
+def link_button_components(buttons: List[LinkButton]) -> List[dict]:
+    """Raw action rows of link buttons (type 2, style 5), five per row,
+    capped at Discord's five rows per message."""
+    rows = [
+        {
+            "type": 1,
+            "components": [
+                {"type": 2, "style": 5, "label": label, "url": url}
+                for label, url in chunk
+            ],
+        }
+        for chunk in _chunks(buttons, 5)
+    ]
+    return rows[:5]
+
+
+async def send_release_message(
+    channel: discord.TextChannel,
+    embeds: List[discord.Embed],
+    buttons: List[LinkButton],
+) -> None:
+    global _cached_channel
+    await LIMITS["discord_channel"].acquire()
+
+    payload: Dict[str, Any] = {"embeds": [e.to_dict() for e in embeds]}
+    if buttons:
+        payload["components"] = link_button_components(buttons)
+
+    try:
+        # channel.send only takes components via a View; post the raw payload
+        # instead so link-only messages skip the View bookkeeping entirely.
+        await client.http.request(
+            Route("POST", "/channels/{channel_id}/messages", channel_id=channel.id),
+            json=payload,
+        )
+    except discord.NotFound:
+        # Channel disappeared (deleted/recreated); drop the cached handle so
+        # the next cycle re-resolves it.
+        if channel is _cached_channel:
+            _cached_channel = None
+        raise
+
+
+# Sentinel returned by ConditionalFetcher.fetch_json when the server says the
+# payload has not changed (HTTP 304), so callers can skip parsing entirely.
+UNCHANGED = object()
+
+
+class ConditionalFetcher:
+    """
+    Conditional-GET wrapper around fetch_json: remembers ETag/Last-Modified
+    per URL and sends If-None-Match/If-Modified-Since so unchanged payloads
+    come back as a bodyless 304 instead of a full download + parse.
+    """
+    def __init__(self, cache: JsonCache):
+        self._cache = cache
+        self._etags = cache.etags
+
+    async def fetch_json(
+        self,
+        session: aiohttp.ClientSession,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        headers = dict(headers or {})
+        cached = self._etags.get(url)
+        if cached:
+            etag, last_modified = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        bucket = LIMITS.get(urlsplit(url).hostname or "")
+        if bucket is not None:
+            await bucket.acquire()
+
+        async with session.get(url, headers=headers) as resp:
+            if bucket is not None:
+                bucket.update_from_headers(resp.headers)
+            if resp.status == 304:
+                return UNCHANGED
+            resp.raise_for_status()
+            etag = resp.headers.get("ETag", "")
+            last_modified = resp.headers.get("Last-Modified", "")
+            if (etag or last_modified) and self._etags.get(url) != (etag, last_modified):
+                self._cache.set_etag(url, etag, last_modified)
+            return orjson.loads(await resp.read())
+
+
+# Transient statuses worth retrying; anything else fails the poll iteration.
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+def _retry_after_seconds(e: aiohttp.ClientResponseError) -> Optional[float]:
+    if e.headers is None:
+        return None
+    raw = (e.headers.get("Retry-After") or "").strip()
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+async def fetch_json_retry(
     session: aiohttp.ClientSession,
     url: str,
     headers: Optional[Dict[str, str]] = None,
+    max_attempts: int = 5,
 ) -> Any:
-    async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-        resp.raise_for_status()
-        return await resp.json()
+    """fetcher.fetch_json with exponential backoff + jitter on 429/5xx,
+    honoring Retry-After when the server sends one."""
+    for attempt in range(max_attempts):
+        try:
+            return await fetcher.fetch_json(session, url, headers=headers)
+        except aiohttp.ClientResponseError as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == max_attempts - 1:
+                raise
+            delay = _retry_after_seconds(e)
+            if delay is None:
+                delay = min(60, (2 ** attempt) * 0.5) + random.uniform(0, 0.5)
+            await asyncio.sleep(delay)
 
 
 def make_absolute_url(base: str, maybe_relative: str) -> str:
@@ -186,7 +766,7 @@ def make_absolute_url(base: str, maybe_relative: str) -> str:
 
 
 def modtale_download_url(project_uuid: str, version_number: str) -> str:
-    return f"{MODTALE_BASE_URL.rstrip('/')}/api/v1/projects/{project_uuid}/versions/{version_number}/download"
+    return f"{MODTALE_BASE_TRIMMED}/api/v1/projects/{project_uuid}/versions/{version_number}/download"
 
 def modtale_icon_url_from_project(project: dict) -> str:
     icon = (project.get("imageUrl") or "").strip()
@@ -201,37 +781,24 @@ def build_modtale_embed_and_view(project_uuid: str, project: dict, version: dict
     version_number = str(version.get("versionNumber", "")).strip() or str(version.get("id", "")).strip()
     author = project.get("author", "Unknown Author")
 
-    # Sets Modtale title, description, and color on the left side of the bots message. 
-    embed = discord.Embed(
-        title=f"A new version of {title} is available",
-        description=f"**Version:** `{version_number}`\n\n*A new version has been published on Modtale.*",
-        color=discord.Color(0x0F172A),
-    )
+    # Sets Modtale title, description, and color on the left side of the bots message.
+    d = dict(_EMBED_TEMPLATE)
+    d["title"] = f"A new version of {title} is available"
+    d["description"] = f"**Version:** `{version_number}`\n\n*A new version has been published on Modtale.*"
+    d["footer"] = {"text": f"By {author}"}
 
     icon_url = modtale_icon_url_from_project(project)
     if icon_url:
-        embed.set_thumbnail(url=icon_url)
+        d["thumbnail"] = {"url": icon_url}
 
-    embed.set_footer(text=f"By {author}")
+    embed = discord.Embed.from_dict(d)
 
-    view = discord.ui.View(timeout=None)
+    buttons: List[LinkButton] = []
     if version_number:
         dl = modtale_download_url(project_uuid, version_number)
-        view.add_item(discord.ui.Button(label="Download from Modtale", url=dl))
-
-    return embed, view
+        buttons.append(("Download from Modtale", dl))
 
-
-def pick_new_modtale_versions(project_json: Dict[str, Any], seen: Set[str]) -> List[Dict[str, Any]]:
-    versions = project_json.get("versions") or []
-    new_items: List[Dict[str, Any]] = []
-    for v in versions:
-        vid = str(v.get("id", "")).strip()
-        if not vid:
-            continue
-        if vid not in seen:
-            new_items.append(v)
-    return new_items
+    return embed, buttons
 
 
 def curseforge_modern_file_page_url(project_slug: str, file_id: str) -> str:
@@ -264,7 +831,32 @@ def parse_cfwidget_files(project_json: dict) -> list[dict]:
     return out
 
 
-def build_curseforge_embed_and_view(project_slug: str, project_json: dict, file_obj: dict) -> tuple[discord.Embed, discord.ui.View]:
+@functools.lru_cache(maxsize=256)
+def _curseforge_embed_payload(
+    project_slug: str,
+    file_id: str,
+    project_title: str,
+    file_display: str,
+    author: str,
+    thumb: str,
+) -> tuple[dict, str]:
+    """Pure, memoized embed payload for one (project, file) pair so a send
+    retry does not rebuild the same Embed dict from scratch."""
+    file_page = curseforge_modern_file_page_url(project_slug, file_id)
+
+    # Sets CurseForge title, description, and color on the left side of the bots message.
+    d = dict(_EMBED_TEMPLATE)
+    d["title"] = f"A new version of {project_title} is available"
+    d["description"] = f"**Version:** `{file_display}`\n\n*A new file has been published on CurseForge.*"
+    d["footer"] = {"text": f"By {author}"}
+
+    if thumb:
+        d["thumbnail"] = {"url": thumb}
+
+    return d, file_page
+
+
+def build_curseforge_embed_and_view(project_slug: str, project_json: dict, file_obj: dict) -> tuple[discord.Embed, list[LinkButton]]:
     project_title = (
         project_json.get("title")
         or project_json.get("name")
@@ -287,90 +879,317 @@ def build_curseforge_embed_and_view(project_slug: str, project_json: dict, file_
 
     file_id = str(file_obj.get("id", "")).strip()
 
-    file_page = curseforge_modern_file_page_url(project_slug, file_id)
-    file_dl = curseforge_modern_file_download_url(project_slug, file_id)
-
-    # Sets CurseForge title, description, and color on the left side of the bots message. 
-    embed = discord.Embed(
-        title=f"A new version of {project_title} is available",
-        description=f"**Version:** `{file_display}`\n\n*A new file has been published on CurseForge.*",
-        color=discord.Color(0x0F172A),
-    )
-
     thumb = (
         project_json.get("thumbnail")
         or project_json.get("logo")
         or (project_json.get("attachments") or {}).get("logo")
         or project_json.get("avatar")
     )
-    if isinstance(thumb, str) and thumb.startswith("http"):
-        embed.set_thumbnail(url=thumb)
+    if not (isinstance(thumb, str) and thumb.startswith("http")):
+        thumb = ""
 
-    embed.set_footer(text=f"By {author}")
+    embed_dict, file_page = _curseforge_embed_payload(
+        project_slug, file_id, str(project_title), str(file_display), str(author), thumb
+    )
+    embed = discord.Embed.from_dict(embed_dict)
 
-    view = discord.ui.View(timeout=None)
-    view.add_item(discord.ui.Button(label="Download from CurseForge", url=file_page))
+    buttons: List[LinkButton] = [("Download from CurseForge", file_page)]
     # If you want the direct download link too, uncomment:
-    # view.add_item(discord.ui.Button(label="Direct download", url=file_dl))
+    # buttons.append(("Direct download", curseforge_modern_file_download_url(project_slug, file_id)))
 
-    return embed, view
+    return embed, buttons
 
 
 intents = discord.Intents.default()
 client = discord.Client(intents=intents)
 
 cfg = load_config()
-cache = JsonCache(CACHE_FILE)
+
+# CACHE_BACKEND=redis shares seen/etag state across replicas; the default
+# json backend keeps the single-instance cache.json behavior.
+if (os.getenv("CACHE_BACKEND") or "json").strip().lower() == "redis":
+    cache = RedisCache(require_env("REDIS_URL"))
+else:
+    cache = JsonCache(CACHE_FILE)
 cache.load()
+fetcher = ConditionalFetcher(cache)
 
 http_session: Optional[aiohttp.ClientSession] = None
 
+# Timestamp of the last verified Modtale webhook delivery; lets the polling
+# fallback skip a cycle when the push path is clearly alive.
+last_webhook_ts: float = 0.0
+_webhook_runner: Optional[web.AppRunner] = None
+
+
+def webhook_enabled() -> bool:
+    return cfg.webhook_port > 0 and bool(cfg.webhook_secret)
+
+
+def verify_webhook_signature(secret: str, body: bytes, signature: str) -> bool:
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, (signature or "").strip().lower())
+
+
+async def handle_modtale_webhook(request: web.Request) -> web.Response:
+    global last_webhook_ts
+
+    body = await request.read()
+    signature = request.headers.get("X-Modtale-Signature", "")
+    if not verify_webhook_signature(cfg.webhook_secret, body, signature):
+        return web.Response(status=401, text="bad signature")
+
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return web.Response(status=400, text="bad json")
+
+    project = payload.get("project") or {}
+    version = payload.get("version") or {}
+    project_uuid = str(payload.get("projectUuid") or project.get("uuid") or "").strip()
+    if not project_uuid or not version:
+        return web.Response(status=400, text="missing project/version")
+
+    last_webhook_ts = time.monotonic()
+
+    vid = str(version.get("id", "")).strip()
+    if vid:
+        if vid in cache.get_modtale_seen(project_uuid):
+            return web.Response(text="already seen")
+        # Same claim as the poll path: with shared state only one replica
+        # wins the id and announces the delivery.
+        if not await cache.claim_modtale_new(project_uuid, [vid]):
+            return web.Response(text="already seen")
+
+    try:
+        channel = await get_target_channel()
+        embed, buttons = build_modtale_embed_and_view(project_uuid, project, version)
+        await send_release_message(channel, [embed], buttons)
+        if vid:
+            cache.mark_modtale_seen(project_uuid, vid)
+        await asyncio.to_thread(cache.save_if_dirty)
+    except Exception as e:
+        print(f"[webhook:{project_uuid}] Error: {e}")
+        return web.Response(status=500, text="delivery failed")
+
+    return web.Response(text="ok")
+
+
+async def start_webhook_server() -> None:
+    global _webhook_runner
+    if _webhook_runner is not None:
+        return
+
+    app = web.Application()
+    app.router.add_post("/modtale/webhook", handle_modtale_webhook)
+
+    _webhook_runner = web.AppRunner(app)
+    await _webhook_runner.setup()
+    site = web.TCPSite(_webhook_runner, port=cfg.webhook_port)
+    await site.start()
+    print(f"Webhook listener on port {cfg.webhook_port}")
+
+
+async def register_modtale_webhook() -> None:
+    """Best-effort registration of our public URL with Modtale's subscription API."""
+    if http_session is None or not cfg.webhook_public_url:
+        return
+
+    url = f"{MODTALE_BASE_TRIMMED}/api/v1/webhooks"
+    for p in cfg.modtale_projects:
+        headers: Dict[str, str] = {"Accept": "application/json"}
+        if p.api_token:
+            headers["X-MODTALE-KEY"] = p.api_token
+        body = {
+            "projectUuid": p.project_uuid,
+            "url": cfg.webhook_public_url,
+            "events": ["version.published"],
+        }
+        try:
+            async with http_session.post(url, json=body, headers=headers) as resp:
+                if resp.status >= 400:
+                    print(f"[webhook:{p.project_uuid}] Registration failed: HTTP {resp.status}")
+        except Exception as e:
+            print(f"[webhook:{p.project_uuid}] Registration error: {e}")
+
+
+# The target channel is constant for the bot's lifetime; resolve once and
+# reuse instead of a lookup (or worse, a REST fetch) per poll cycle.
+_cached_channel: Optional[discord.TextChannel] = None
+
 
 async def get_target_channel() -> discord.TextChannel:
+    global _cached_channel
+    if _cached_channel is not None:
+        return _cached_channel
+
     ch = client.get_channel(cfg.channel_id)
     if isinstance(ch, discord.TextChannel):
+        _cached_channel = ch
         return ch
     fetched = await client.fetch_channel(cfg.channel_id)
     if not isinstance(fetched, discord.TextChannel):
         raise RuntimeError("CHANNEL_ID is not a text channel.")
+    _cached_channel = fetched
     return fetched
 
 
-@tasks.loop(seconds=60)
-async def poll_curseforge():
-    if http_session is None:
+# Bounds how many project fetches run concurrently within one poll cycle.
+_fetch_sem = asyncio.Semaphore(16)
+
+# Discord allows up to 10 embeds per message; batching bursty drops cuts the
+# REST calls (and 429 risk) by the same factor.
+MAX_EMBEDS_PER_MESSAGE = 10
+
+
+def _chunks(seq: List[Any], size: int):
+    for i in range(0, len(seq), size):
+        yield seq[i:i + size]
+
+
+def _log_poll_results(prefix: str, keys: List[str], results: List[Any]) -> None:
+    for key, r in zip(keys, results):
+        if isinstance(r, aiohttp.ClientResponseError):
+            print(f"[{prefix}:{key}] HTTP error {r.status}: {r.message}")
+        elif isinstance(r, BaseException):
+            print(f"[{prefix}:{key}] Error: {r}")
+
+
+@dataclass(frozen=True)
+class SourceAdapter:
+    """One release source (CurseForge, Modtale): everything _poll_one needs
+    to fetch a project, diff its items against the seen-set, and post."""
+    name: str                                        # log prefix
+    ns: str                                          # cache namespace
+    key_fn: Callable[[Any], str]                     # project cfg -> cache key
+    url_fn: Callable[[Any], str]
+    headers_fn: Callable[[Any], Dict[str, str]]
+    items_fn: Callable[[dict], List[dict]]
+    id_fn: Callable[[dict], str]
+    seen_fn: Callable[[str], Any]
+    mark_fn: Callable[[str, str], None]
+    claim_fn: Callable[[str, List[str]], Awaitable[List[str]]]
+    build_fn: Callable[[Any, dict, dict], Tuple[discord.Embed, List[LinkButton]]]
+    post_oldest_first: bool = False
+
+
+def _modtale_headers(p: ModtaleProjectCfg) -> Dict[str, str]:
+    headers: Dict[str, str] = {"Accept": "application/json"}
+    if p.api_token:
+        headers["X-MODTALE-KEY"] = p.api_token
+    return headers
+
+
+CURSEFORGE_SOURCE = SourceAdapter(
+    name="curseforge",
+    ns="cf",
+    key_fn=lambda p: p.project_id,
+    url_fn=lambda p: cfwidget_project_url(p.project_id),
+    headers_fn=lambda p: {"Accept": "application/json"},
+    items_fn=parse_cfwidget_files,
+    id_fn=lambda f: str(f.get("id", "")).strip(),
+    seen_fn=cache.get_curseforge_seen,
+    mark_fn=cache.mark_curseforge_seen,
+    claim_fn=cache.claim_curseforge_new,
+    build_fn=lambda p, pj, f: build_curseforge_embed_and_view(p.project_slug, pj, f),
+    # Post oldest-first so Discord reads nicely
+    post_oldest_first=True,
+)
+
+MODTALE_SOURCE = SourceAdapter(
+    name="modtale",
+    ns="mt",
+    key_fn=lambda p: p.project_uuid,
+    url_fn=lambda p: f"{MODTALE_BASE_TRIMMED}/api/v1/projects/{p.project_uuid}",
+    headers_fn=_modtale_headers,
+    items_fn=lambda pj: pj.get("versions") or [],
+    id_fn=lambda v: str(v.get("id", "")).strip(),
+    seen_fn=cache.get_modtale_seen,
+    mark_fn=cache.mark_modtale_seen,
+    claim_fn=cache.claim_modtale_new,
+    build_fn=lambda p, pj, v: build_modtale_embed_and_view(p.project_uuid, pj, v),
+)
+
+
+async def _poll_one(source: SourceAdapter, p: Any, channel: discord.TextChannel) -> None:
+    key = source.key_fn(p)
+
+    async with _fetch_sem:
+        project_json = await fetch_json_retry(http_session, source.url_fn(p), headers=source.headers_fn(p))
+    if project_json is UNCHANGED:
         return
 
-    channel = await get_target_channel()
+    items = source.items_fn(project_json)
+    if not items:
+        return
 
-    for p in cfg.curseforge_projects:
-        url = cfwidget_project_url(p.project_id)
-        headers = {"Accept": "application/json"}
+    by_id = {source.id_fn(item): item for item in items}
+    by_id.pop("", None)
+    seen = source.seen_fn(key)
+
+    init_key = f"{source.ns}:{key}"
+    if cfg.backfill_on_first_seen and init_key not in cache.initialized:
+        cache.mark_initialized(init_key)
+        # Never-before-seen project: seed the full history silently instead
+        # of flooding the channel (and Discord's rate limits) with old items.
+        # Seed through mark_fn so every backend persists the ids (the Redis
+        # backend would otherwise only fill its in-RAM mirror).
+        if not seen:
+            for item_id in by_id:
+                source.mark_fn(key, item_id)
+            return
 
-        try:
-            project_json = await fetch_json(http_session, url, headers=headers)
-            files = parse_cfwidget_files(project_json)
-            if not files:
-                continue
+    new_ids = [item_id for item_id in by_id if item_id not in seen]
+    if not new_ids:
+        return
 
-            seen = cache.get_curseforge_seen(p.project_id)
-            new_files = [f for f in files if str(f.get("id")) not in seen]
-            if not new_files:
-                continue
+    # The RAM diff above only dedups against what this replica has seen;
+    # claim the ids in the backend before posting so that with shared state
+    # (Redis) exactly one live replica announces each release.
+    claimed = set(await source.claim_fn(key, new_ids))
+    if not claimed:
+        return
 
-            # Post oldest-first so Discord reads nicely
-            for f in reversed(new_files):
-                fid = str(f.get("id"))
-                embed, view = build_curseforge_embed_and_view(p.project_slug, project_json, f)
-                await channel.send(embed=embed, view=view)
-                seen.add(fid)
+    new_items = [item for item_id, item in by_id.items() if item_id in claimed]
+    if source.post_oldest_first:
+        new_items.reverse()
 
-            cache.save()
+    if len(new_items) == 1:
+        item = new_items[0]
+        embed, buttons = source.build_fn(p, project_json, item)
+        await send_release_message(channel, [embed], buttons)
+        source.mark_fn(key, source.id_fn(item))
+        return
 
-        except aiohttp.ClientResponseError as e:
-            print(f"[curseforge:{p.project_id}] HTTP error {e.status}: {e.message}")
-        except Exception as e:
-            print(f"[curseforge:{p.project_id}] Error: {e}")
+    # Burst of releases: batch up to 10 embeds per message, merging the
+    # per-item download buttons (well under the 25-component cap).
+    built = [(source.build_fn(p, project_json, item), source.id_fn(item)) for item in new_items]
+    for chunk in _chunks(built, MAX_EMBEDS_PER_MESSAGE):
+        embeds = [embed for (embed, _buttons), _item_id in chunk]
+        merged = [b for (_embed, buttons), _item_id in chunk for b in buttons]
+        await send_release_message(channel, embeds, merged)
+        for _pair, item_id in chunk:
+            source.mark_fn(key, item_id)
+
+
+async def _poll_source(source: SourceAdapter, projects: List[Any]) -> None:
+    channel = await get_target_channel()
+
+    results = await asyncio.gather(
+        *[_poll_one(source, p, channel) for p in projects],
+        return_exceptions=True,
+    )
+    _log_poll_results(source.name, [source.key_fn(p) for p in projects], results)
+
+    await asyncio.to_thread(cache.save_if_dirty)
+
+
+@tasks.loop(seconds=60)
+async def poll_curseforge():
+    if http_session is None:
+        return
+
+    await _poll_source(CURSEFORGE_SOURCE, cfg.curseforge_projects)
 
 
 @poll_curseforge.before_loop
@@ -384,42 +1203,30 @@ async def poll_modtale():
     if http_session is None:
         return
 
-    channel = await get_target_channel()
-
-    for p in cfg.modtale_projects:
-        url = f"{MODTALE_BASE_URL.rstrip('/')}/api/v1/projects/{p.project_uuid}"
-        headers: Dict[str, str] = {"Accept": "application/json"}
-        if p.api_token:
-            headers["X-MODTALE-KEY"] = p.api_token
-
-        try:
-            project = await fetch_json(http_session, url, headers=headers)
+    # When the webhook path delivered within the current window, the poll is
+    # redundant — skip the whole cycle.
+    if webhook_enabled() and last_webhook_ts:
+        interval = poll_modtale.seconds or cfg.poll_seconds
+        if time.monotonic() - last_webhook_ts < interval:
+            return
 
-            seen = cache.get_modtale_seen(p.project_uuid)
-            new_versions = pick_new_modtale_versions(project, seen)
-            if not new_versions:
-                continue
+    await _poll_source(MODTALE_SOURCE, cfg.modtale_projects)
 
-            for v in new_versions:
-                embed, view = build_modtale_embed_and_view(p.project_uuid, project, v)
-                await channel.send(embed=embed, view=view)
 
-                vid = str(v.get("id", "")).strip()
-                if vid:
-                    seen.add(vid)
+@poll_modtale.before_loop
+async def before_modtale():
+    await client.wait_until_ready()
+    await asyncio.sleep(2)
 
-            cache.save()
 
-        except aiohttp.ClientResponseError as e:
-            print(f"[modtale:{p.project_uuid}] HTTP error {e.status}: {e.message}")
-        except Exception as e:
-            print(f"[modtale:{p.project_uuid}] Error: {e}")
+@tasks.loop(minutes=30)
+async def compact_cache():
+    await asyncio.to_thread(cache.compact)
 
 
-@poll_modtale.before_loop
-async def before_modtale():
+@compact_cache.before_loop
+async def before_compact():
     await client.wait_until_ready()
-    await asyncio.sleep(2)
 
 
 @client.event
@@ -427,10 +1234,25 @@ async def on_ready():
     global http_session
 
     if http_session is None:
-        http_session = aiohttp.ClientSession()
+        http_session = make_http_session()
+
+    if isinstance(cache, RedisCache) and not cache.loaded:
+        await cache.load_async()
+
+    try:
+        await get_target_channel()
+    except Exception as e:
+        print(f"[channel] Failed to resolve channel {cfg.channel_id}: {e}")
 
     poll_curseforge.change_interval(seconds=cfg.curseforge_poll_seconds)
-    poll_modtale.change_interval(seconds=cfg.poll_seconds)
+
+    modtale_interval = cfg.poll_seconds
+    if webhook_enabled():
+        await start_webhook_server()
+        await register_modtale_webhook()
+        # Polling becomes a safety net once push delivery is live.
+        modtale_interval = max(cfg.poll_seconds, 3600)
+    poll_modtale.change_interval(seconds=modtale_interval)
 
     if cfg.modtale_projects and not poll_modtale.is_running():
         poll_modtale.start()
@@ -440,13 +1262,19 @@ async def on_ready():
         poll_curseforge.start()
         print(f"CurseForge projects: {len(cfg.curseforge_projects)}")
 
+    if not compact_cache.is_running():
+        compact_cache.start()
+
     print(f"Logged in as {client.user}")
     print("Successfully finished startup!")
 
 
 async def shutdown():
-    global http_session
+    global http_session, _webhook_runner
     try:
+        if _webhook_runner is not None:
+            await _webhook_runner.cleanup()
+            _webhook_runner = None
         if http_session is not None:
             await http_session.close()
             http_session = None
@@ -455,7 +1283,7 @@ async def shutdown():
 
 async def run_bot():
     global http_session
-    http_session = aiohttp.ClientSession()
+    http_session = make_http_session()
 
     try:
         await client.start(cfg.discord_token)
@@ -479,6 +1307,8 @@ def main():
 
         await stop_event.wait()
 
+        await cache.aclose()
+
         await client.close()
 
         await bot_task